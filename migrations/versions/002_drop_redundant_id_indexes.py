@@ -0,0 +1,34 @@
+"""Drop redundant btree indexes on integer primary key columns
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Primary keys are already indexed, so these cost one extra B-tree
+    # write per INSERT without ever being picked by the planner
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_batches_id'), table_name='batches')
+    op.drop_index(op.f('ix_batch_shipments_id'), table_name='batch_shipments')
+    op.drop_index(op.f('ix_batch_rates_id'), table_name='batch_rates')
+    op.drop_index(op.f('ix_batch_errors_id'), table_name='batch_errors')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_batch_errors_id'), 'batch_errors', ['id'], unique=False)
+    op.create_index(op.f('ix_batch_rates_id'), 'batch_rates', ['id'], unique=False)
+    op.create_index(op.f('ix_batch_shipments_id'), 'batch_shipments', ['id'], unique=False)
+    op.create_index(op.f('ix_batches_id'), 'batches', ['id'], unique=False)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
@@ -0,0 +1,24 @@
+"""Add composite (user_id, batch_id) index on batches
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_batches_user_batch', 'batches', ['user_id', 'batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_batches_user_batch', table_name='batches')
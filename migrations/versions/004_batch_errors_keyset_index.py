@@ -0,0 +1,26 @@
+"""Add composite (batch_id, id) index on batch_errors for keyset pagination
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_batch_errors_batch_id_id', 'batch_errors', ['batch_id', 'id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_batch_errors_batch_id_id', table_name='batch_errors')
@@ -0,0 +1,37 @@
+"""Replace single-column child id indexes with batch-scoped composites
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_batch_shipments_batch_shipment', 'batch_shipments',
+        ['batch_id', 'shipment_id'], unique=False,
+    )
+    op.create_index(
+        'ix_batch_rates_batch_rate', 'batch_rates',
+        ['batch_id', 'rate_id'], unique=False,
+    )
+    op.drop_index(op.f('ix_batch_shipments_shipment_id'), table_name='batch_shipments')
+    op.drop_index(op.f('ix_batch_rates_rate_id'), table_name='batch_rates')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_batch_rates_rate_id'), 'batch_rates', ['rate_id'], unique=False)
+    op.create_index(op.f('ix_batch_shipments_shipment_id'), 'batch_shipments', ['shipment_id'], unique=False)
+    op.drop_index('ix_batch_rates_batch_rate', table_name='batch_rates')
+    op.drop_index('ix_batch_shipments_batch_shipment', table_name='batch_shipments')
@@ -0,0 +1,37 @@
+"""Move created_at/updated_at defaults to the database server
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TIMESTAMP_COLUMNS = (
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('batches', 'created_at'),
+    ('batches', 'updated_at'),
+    ('batch_shipments', 'created_at'),
+    ('batch_rates', 'created_at'),
+    ('batch_errors', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in _TIMESTAMP_COLUMNS:
+        op.alter_column(table, column, server_default=None)
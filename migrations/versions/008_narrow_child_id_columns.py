@@ -0,0 +1,43 @@
+"""Narrow shipment_id/rate_id to the 64 chars the API accepts
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-09-01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'batch_shipments', 'shipment_id',
+        existing_type=sa.String(length=255), type_=sa.String(length=64),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'batch_rates', 'rate_id',
+        existing_type=sa.String(length=255), type_=sa.String(length=64),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'batch_rates', 'rate_id',
+        existing_type=sa.String(length=64), type_=sa.String(length=255),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'batch_shipments', 'shipment_id',
+        existing_type=sa.String(length=64), type_=sa.String(length=255),
+        existing_nullable=False,
+    )
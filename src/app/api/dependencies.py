@@ -1,4 +1,5 @@
 from typing import Optional
+import time
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -13,6 +14,32 @@ from ..schemas.token import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/login")
 
+# Short-lived in-process cache mapping raw token -> (user, expiry) so repeat
+# requests from the same client skip both JWT verification and the user SELECT
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict[str, tuple[User, float]] = {}
+
+
+def get_token_payload(token: str = Depends(oauth2_scheme)) -> TokenPayload:
+    """
+    Dependency to decode and validate the JWT without touching the database
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        user_id: str = payload.get("sub")
+        if user_id is None:
+            raise credentials_exception
+        return TokenPayload(sub=user_id)
+    except JWTError:
+        raise credentials_exception
+
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db), token: str = Depends(oauth2_scheme)
@@ -20,6 +47,10 @@ async def get_current_user(
     """
     Dependency to get current authenticated user from JWT token
     """
+    cached = _token_cache.get(token)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -38,6 +69,11 @@ async def get_current_user(
     user_obj = await crud_user.get(db, id=int(token_data.sub))
     if user_obj is None:
         raise credentials_exception
+
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    _token_cache[token] = (user_obj, time.monotonic() + _TOKEN_CACHE_TTL)
+
     return user_obj
 
 
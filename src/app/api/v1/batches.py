@@ -1,27 +1,65 @@
 from typing import Any
+import asyncio
+import contextlib
+import hashlib
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...api.dependencies import get_current_active_user
+from ...api.dependencies import get_current_active_user, get_token_payload
 from ...core.database import get_db
 from ...crud.crud_batch import batch as crud_batch
+from ...models.batch import Batch
 from ...models.user import User
+from ...schemas.token import TokenPayload
 from ...schemas.batch import (
     Batch as BatchSchema,
-    BatchCreate,
     BatchUpdate,
     BatchAddRequest,
     BatchRemoveRequest,
     BatchProcessLabelsRequest,
     BatchErrorsResponse,
-    BatchError as BatchErrorSchema,
+    BatchErrorListAdapter,
 )
 from ...utils.cache import cache
+from ...utils.writer import writer
 
 router = APIRouter()
 
 
+async def _get_owned_batch(db: AsyncSession, batch_id: str, token: TokenPayload) -> Batch:
+    """
+    Fetch a batch scoped to the requesting user via the composite index
+    """
+    batch = await crud_batch.get_for_user(db, batch_id=batch_id, user_id=int(token.sub))
+
+    if batch is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch not found",
+        )
+
+    return batch
+
+
+async def _get_owned_batch_full(db: AsyncSession, batch_id: str, token: TokenPayload) -> Any:
+    """
+    Fetch a batch with its shipments/rates/errors in a single round trip
+    """
+    batch = await crud_batch.get_full_for_user(
+        db, batch_id=batch_id, user_id=int(token.sub)
+    )
+
+    if batch is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch not found",
+        )
+
+    return batch
+
+
 @router.post("/{batch_id}/add", status_code=status.HTTP_204_NO_CONTENT)
 async def add_to_batch(
     batch_id: str,
@@ -32,69 +70,67 @@ async def add_to_batch(
     """
     Add shipments or rates to a batch
     """
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
-
-    if not batch:
-        # Create new batch if it doesn't exist
-        batch_create = BatchCreate(batch_id=batch_id)
-        batch = await crud_batch.create_with_user(db, obj_in=batch_create, user_id=current_user.id)
+    # The one route that writes under the token's subject: resolve the
+    # user so deleted or deactivated accounts are rejected, not inserted
+    # as dangling foreign keys (read routes filter is_active in SQL)
+    batch = await crud_batch.upsert_by_batch_id(
+        db, batch_id=batch_id, user_id=current_user.id
+    )
 
-    # Add shipments if provided
-    if request.shipment_ids:
-        batch = await crud_batch.add_shipments(db, batch=batch, shipment_ids=request.shipment_ids)
-
-    # Add rates if provided
-    if request.rate_ids:
-        batch = await crud_batch.add_rates(db, batch=batch, rate_ids=request.rate_ids)
+    if request.shipment_ids or request.rate_ids:
+        if writer.running:
+            # Commit so the batch row is visible to the writer's session,
+            # then let the writer coalesce our inserts with concurrent requests
+            await db.commit()
+            await writer.submit(
+                batch_id=batch.id,
+                shipment_ids=request.shipment_ids,
+                rate_ids=request.rate_ids,
+            )
+        else:
+            # Writer not running (tests, scripts): insert on the request session
+            if request.shipment_ids:
+                batch = await crud_batch.add_shipments(
+                    db, batch=batch, shipment_ids=request.shipment_ids
+                )
+            if request.rate_ids:
+                batch = await crud_batch.add_rates(db, batch=batch, rate_ids=request.rate_ids)
 
     # Invalidate cache for this batch
-    await cache.delete(f"batch:{batch_id}")
+    await cache.delete_many(f"batch:{batch_id}")
 
     return None
 
 
-@router.get("/{batch_id}/errors", response_model=BatchErrorsResponse)
+@router.get("/{batch_id}/errors")
 async def get_batch_errors(
     batch_id: str,
-    page: int = Query(1, ge=1, description="Page number"),
+    cursor: int = Query(0, ge=0, description="Return errors with ID greater than this"),
     pagesize: int = Query(25, ge=1, le=100, description="Items per page"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    token: TokenPayload = Depends(get_token_payload),
 ) -> Any:
     """
-    Get errors for a batch with pagination
+    Get errors for a batch with keyset pagination
     """
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
+    batch = await _get_owned_batch(db, batch_id, token)
 
-    if not batch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Batch not found",
-        )
-
-    # Check if user owns this batch
-    if batch.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
-
-    skip = (page - 1) * pagesize
-    errors = await crud_batch.get_errors(db, batch=batch, skip=skip, limit=pagesize)
+    errors = await crud_batch.get_errors(db, batch=batch, after_id=cursor, limit=pagesize)
 
-    # Build pagination links
+    # Build pagination links; the cursor is the last error ID on this page
     links = {
-        "first": f"/api/v1/batches/{batch_id}/errors?page=1&pagesize={pagesize}",
-        "last": f"/api/v1/batches/{batch_id}/errors?page={page}&pagesize={pagesize}",
+        "first": f"/api/v1/batches/{batch_id}/errors?cursor=0&pagesize={pagesize}",
     }
 
-    if page > 1:
-        links["prev"] = f"/api/v1/batches/{batch_id}/errors?page={page-1}&pagesize={pagesize}"
-
     if len(errors) == pagesize:
-        links["next"] = f"/api/v1/batches/{batch_id}/errors?page={page+1}&pagesize={pagesize}"
+        links["next"] = (
+            f"/api/v1/batches/{batch_id}/errors?cursor={errors[-1].id}&pagesize={pagesize}"
+        )
+
+    # One pydantic-core loop over the page instead of per-row construction
+    error_items = BatchErrorListAdapter.validate_python(errors, from_attributes=True)
 
-    return {"errors": errors, "links": links}
+    return BatchErrorsResponse.model_construct(errors=error_items, links=links)
 
 
 @router.post("/{batch_id}/process/labels", status_code=status.HTTP_204_NO_CONTENT)
@@ -102,25 +138,12 @@ async def process_batch_labels(
     batch_id: str,
     request: BatchProcessLabelsRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    token: TokenPayload = Depends(get_token_payload),
 ):
     """
     Process batch ID labels
     """
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
-
-    if not batch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Batch not found",
-        )
-
-    # Check if user owns this batch
-    if batch.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
+    batch = await _get_owned_batch(db, batch_id, token)
 
     # Update batch with processing information
     update_data = BatchUpdate(
@@ -134,7 +157,7 @@ async def process_batch_labels(
     await crud_batch.update(db, db_obj=batch, obj_in=update_data)
 
     # Invalidate cache
-    await cache.delete(f"batch:{batch_id}")
+    await cache.delete_many(f"batch:{batch_id}")
 
     # In production, this would trigger background job to process labels
     # For now, we just update the status
@@ -147,25 +170,12 @@ async def remove_from_batch(
     batch_id: str,
     request: BatchRemoveRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    token: TokenPayload = Depends(get_token_payload),
 ):
     """
     Remove shipments or rates from a batch
     """
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
-
-    if not batch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Batch not found",
-        )
-
-    # Check if user owns this batch
-    if batch.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
+    batch = await _get_owned_batch(db, batch_id, token)
 
     # Remove shipments if provided
     if request.shipment_ids:
@@ -178,121 +188,64 @@ async def remove_from_batch(
         batch = await crud_batch.remove_rates(db, batch=batch, rate_ids=request.rate_ids)
 
     # Invalidate cache
-    await cache.delete(f"batch:{batch_id}")
+    await cache.delete_many(f"batch:{batch_id}")
 
     return None
 
 
-@router.get("/{batch_id}", response_model=BatchSchema)
+def _batch_response(payload: bytes, request: Request) -> Response:
+    """
+    Wrap serialized batch bytes, honoring If-None-Match with a 304
+    """
+    etag = f'W/"{hashlib.md5(payload).hexdigest()}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get("/{batch_id}")
 async def get_batch(
     batch_id: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    token: TokenPayload = Depends(get_token_payload),
 ) -> Any:
     """
     Get batch by ID with caching
     """
-    # Try to get from cache first
-    cached_batch = await cache.get(f"batch:{batch_id}")
-    if cached_batch:
-        return cached_batch
-
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
+    # Kick off the DB fetch while the cache lookup is in flight so a cold
+    # cache pays max(redis, db) latency instead of their sum
+    db_task = asyncio.create_task(_get_owned_batch_full(db, batch_id, token))
 
-    if not batch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Batch not found",
-        )
+    cached_batch = await cache.get_raw(f"batch:{batch_id}")
+    if cached_batch:
+        db_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await db_task
+        return _batch_response(cached_batch, request)
 
-    # Check if user owns this batch
-    if batch.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
+    batch = await db_task
 
-    # Cache the result for 5 minutes
-    batch_dict = {
-        "id": batch.id,
-        "batch_id": batch.batch_id,
-        "user_id": batch.user_id,
-        "status": batch.status,
-        "ship_date": batch.ship_date.isoformat() if batch.ship_date else None,
-        "label_layout": batch.label_layout,
-        "label_format": batch.label_format,
-        "display_scheme": batch.display_scheme,
-        "created_at": batch.created_at.isoformat(),
-        "updated_at": batch.updated_at.isoformat(),
-        "shipments": [
-            {
-                "id": s.id,
-                "batch_id": s.batch_id,
-                "shipment_id": s.shipment_id,
-                "tracking_number": s.tracking_number,
-                "carrier": s.carrier,
-                "service_code": s.service_code,
-                "label_data": s.label_data,
-                "created_at": s.created_at.isoformat(),
-            }
-            for s in batch.shipments
-        ],
-        "rates": [
-            {
-                "id": r.id,
-                "batch_id": r.batch_id,
-                "rate_id": r.rate_id,
-                "carrier": r.carrier,
-                "service_type": r.service_type,
-                "amount": r.amount,
-                "currency": r.currency,
-                "created_at": r.created_at.isoformat(),
-            }
-            for r in batch.rates
-        ],
-        "errors": [
-            {
-                "id": e.id,
-                "batch_id": e.batch_id,
-                "error_code": e.error_code,
-                "error_message": e.error_message,
-                "error_type": e.error_type,
-                "source": e.source,
-                "created_at": e.created_at.isoformat(),
-            }
-            for e in batch.errors
-        ],
-    }
+    # Serialize once, cache the bytes for 5 minutes and return them as-is
+    payload = orjson.dumps(BatchSchema.model_validate(batch).model_dump())
 
-    await cache.set(f"batch:{batch_id}", batch_dict, expire=300)
+    await cache.set(f"batch:{batch_id}", payload, expire=300)
 
-    return batch
+    return _batch_response(payload, request)
 
 
 @router.delete("/{batch_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_batch(
     batch_id: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    token: TokenPayload = Depends(get_token_payload),
 ):
     """
     Delete a batch completely
     """
-    batch = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
-
-    if not batch:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Batch not found",
-        )
-
-    if batch.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions",
-        )
+    batch = await _get_owned_batch(db, batch_id, token)
 
     await crud_batch.remove(db, id=batch.id)
-    await cache.delete(f"batch:{batch_id}")
+    await cache.delete_many(f"batch:{batch_id}")
 
     return None
@@ -1,6 +1,7 @@
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...api.dependencies import get_current_active_user, get_current_active_superuser
@@ -8,18 +9,39 @@ from ...core.database import get_db
 from ...crud.crud_user import user as crud_user
 from ...models.user import User
 from ...schemas.user import User as UserSchema, UserCreate, UserUpdate
+from ...utils.cache import cache
 
 router = APIRouter()
 
 
-@router.get("/me", response_model=UserSchema)
+@router.get("/me", response_class=ORJSONResponse)
 async def read_user_me(
+    request: Request,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get current user information
     """
-    return current_user
+    # A validator that already holds the current representation gets a
+    # bodyless 304 instead of a re-serialized payload
+    etag = f'W/"{int(current_user.updated_at.timestamp())}-{current_user.id}"'
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    # The row was just loaded by the auth dependency; serialize it
+    # directly instead of revalidating through the response model
+    return ORJSONResponse(
+        {
+            "id": current_user.id,
+            "email": current_user.email,
+            "full_name": current_user.full_name,
+            "is_active": current_user.is_active,
+            "is_superuser": current_user.is_superuser,
+            "created_at": current_user.created_at,
+            "updated_at": current_user.updated_at,
+        },
+        headers={"ETag": etag},
+    )
 
 
 @router.post("/", response_model=UserSchema)
@@ -50,8 +72,15 @@ async def read_user_by_id(
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
-    Get a specific user by ID
+    Get a specific user by ID with caching
     """
+    # Serve from cache only for requesters already allowed to see the row
+    allowed = user_id == current_user.id or crud_user.is_superuser(current_user)
+    if allowed:
+        cached_user = await cache.get(f"user:{user_id}")
+        if cached_user:
+            return cached_user
+
     user = await crud_user.get(db, id=user_id)
     if not user:
         raise HTTPException(
@@ -59,12 +88,13 @@ async def read_user_by_id(
             detail="The user with this ID does not exist in the system",
         )
 
-    if user == current_user:
-        return user
-
-    if not crud_user.is_superuser(current_user):
+    if user != current_user and not crud_user.is_superuser(current_user):
         raise HTTPException(status_code=400, detail="Not enough permissions")
 
+    # Cache the result for 5 minutes
+    user_dict = UserSchema.model_validate(user).model_dump(mode="json")
+    await cache.set(f"user:{user_id}", user_dict, expire=300)
+
     return user
 
 
@@ -87,6 +117,10 @@ async def update_user(
         )
 
     user = await crud_user.update(db, db_obj=user, obj_in=user_in)
+
+    # Invalidate cache
+    await cache.delete(f"user:{user_id}")
+
     return user
 
 
@@ -113,4 +147,8 @@ async def delete_user(
         )
 
     await crud_user.remove(db, id=user_id)
+
+    # Invalidate cache
+    await cache.delete(f"user:{user_id}")
+
     return None
@@ -17,10 +17,14 @@ class Settings(BaseSettings):
     APP_NAME: str = "FastAPI ShipEngine Batches API"
     DEBUG: bool = True
     API_V1_STR: str = "/api/v1"
+    CORS_ORIGINS: list[str] = []
 
     # Database
     DATABASE_URL: str
     DATABASE_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_STATEMENT_CACHE_SIZE: int = 1024
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -37,6 +41,8 @@ class Settings(BaseSettings):
     # Admin
     ADMIN_EMAIL: str
     ADMIN_PASSWORD: str = "changeme"
+    # Optional pre-computed bcrypt hash; when set, bootstrap skips the kdf
+    ADMIN_PASSWORD_HASH: str = ""
 
 
 settings = Settings()
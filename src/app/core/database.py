@@ -1,5 +1,6 @@
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -14,11 +15,43 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    future=True,
-)
+engine_kwargs: dict = {
+    "echo": settings.DATABASE_ECHO,
+    "future": True,
+    # Pack bulk inserts into the widest multi-VALUES statements the driver allows
+    "insertmanyvalues_page_size": 1000,
+}
+
+if not settings.DATABASE_URL.startswith("sqlite"):
+    # Size the connection pool explicitly so requests reuse pooled DBAPI
+    # connections instead of thrashing open/close under load; a larger
+    # asyncpg statement cache keeps hot queries server-side prepared
+    engine_kwargs.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=3600,
+        pool_pre_ping=False,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """
+        Tune each new SQLite connection: WAL keeps writers from blocking
+        readers and NORMAL avoids an fsync on every commit
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=memory")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -1,11 +1,16 @@
 from datetime import datetime, timedelta
 from typing import Any, Optional
-import hashlib
 
 from jose import jwt
+from passlib.context import CryptContext
 
 from .config import settings
 
+# bcrypt with a capped work factor: ~50ms per hash keeps brute-force
+# expensive without stalling the login path; verification runs in a
+# thread so the event loop stays free (see CRUDUser.authenticate)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
+
 
 def create_access_token(subject: str | Any, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -25,11 +30,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify plain password against hashed password
     """
-    return get_password_hash(plain_password) == hashed_password
+    return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a plain password using SHA256
+    Hash a plain password with bcrypt
     """
-    return hashlib.sha256(password.encode()).hexdigest()
+    return pwd_context.hash(password)
@@ -1,13 +1,86 @@
 from typing import Optional
+import zlib
 
-from sqlalchemy import select, delete
+from sqlalchemy import JSON, select, delete, insert, bindparam, func, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from .crud_base import CRUDBase
 from ..models.batch import Batch, BatchShipment, BatchRate, BatchError
+from ..models.user import User
 from ..schemas.batch import BatchCreate, BatchUpdate
 
+# Error messages longer than this are compressed into error_message_blob
+_ERROR_MESSAGE_INLINE_MAX = 256
+
+# Above this row count, shipment inserts switch from multi-VALUES INSERT
+# to asyncpg's binary COPY, which skips per-row bind overhead
+_COPY_THRESHOLD = 200
+
+# Hot lookup statements built once at import so per-request calls skip
+# re-constructing the select() expression tree
+_GET_BY_BATCH_ID_STMT = select(Batch).where(Batch.batch_id == bindparam("batch_id"))
+_GET_FOR_USER_STMT = (
+    select(Batch)
+    .join(User, Batch.user_id == User.id)
+    .where(
+        Batch.user_id == bindparam("user_id"),
+        Batch.batch_id == bindparam("batch_id"),
+        User.is_active.is_(True),
+    )
+)
+
+
+def _json_agg_children(model, columns: list[str]):
+    """
+    Correlated json_agg subquery aggregating child rows of the outer Batch
+    into a JSON array server-side (PostgreSQL only)
+    """
+    args = []
+    for name in columns:
+        args.append(name)
+        args.append(getattr(model, name))
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(func.json_build_object(*args)),
+                literal_column("'[]'::json"),
+                type_=JSON,
+            )
+        )
+        .where(model.batch_id == Batch.id)
+        .correlate(Batch)
+        .scalar_subquery()
+    )
+
+
+_GET_FULL_FOR_USER_STMT = (
+    select(
+        Batch.__table__,
+        _json_agg_children(
+            BatchShipment,
+            ["id", "batch_id", "shipment_id", "tracking_number", "carrier",
+             "service_code", "label_data", "created_at"],
+        ).label("shipments"),
+        _json_agg_children(
+            BatchRate,
+            ["id", "batch_id", "rate_id", "carrier", "service_type",
+             "amount", "currency", "created_at"],
+        ).label("rates"),
+        _json_agg_children(
+            BatchError,
+            ["id", "batch_id", "error_code", "error_message", "error_type",
+             "source", "created_at"],
+        ).label("errors"),
+    )
+    .join(User, Batch.user_id == User.id)
+    .where(
+        Batch.user_id == bindparam("user_id"),
+        Batch.batch_id == bindparam("batch_id"),
+        User.is_active.is_(True),
+    )
+)
+
 
 class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
     """
@@ -18,17 +91,55 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         """
         Get batch by batch_id string with all relationships loaded
         """
+        result = await db.execute(_GET_BY_BATCH_ID_STMT, {"batch_id": batch_id})
+        return result.scalar_one_or_none()
+
+    async def get_for_user(
+        self, db: AsyncSession, *, batch_id: str, user_id: int
+    ) -> Optional[Batch]:
+        """
+        Get batch by batch_id scoped to an active owning user; ownership is
+        filtered by the composite (user_id, batch_id) index instead of Python
+        """
         result = await db.execute(
-            select(Batch)
-            .where(Batch.batch_id == batch_id)
-            .options(
-                selectinload(Batch.shipments),
-                selectinload(Batch.rates),
-                selectinload(Batch.errors),
-            )
+            _GET_FOR_USER_STMT, {"batch_id": batch_id, "user_id": user_id}
         )
         return result.scalar_one_or_none()
 
+    async def get_full_for_user(self, db: AsyncSession, *, batch_id: str, user_id: int):
+        """
+        Get a batch plus all child rows in one round trip. On PostgreSQL
+        the children are aggregated server-side with json_agg so a large
+        batch costs 1 query instead of 1 + three selectin loads; other
+        dialects fall back to the ORM path and its eager relationships
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return await self.get_for_user(db, batch_id=batch_id, user_id=user_id)
+        result = await db.execute(
+            _GET_FULL_FOR_USER_STMT, {"batch_id": batch_id, "user_id": user_id}
+        )
+        row = result.mappings().first()
+        return dict(row) if row is not None else None
+
+    async def upsert_by_batch_id(
+        self, db: AsyncSession, *, batch_id: str, user_id: int
+    ) -> Batch:
+        """
+        Get-or-create a batch in a single round trip; on conflict the
+        existing row is returned and its ownership left untouched
+        """
+        stmt = (
+            pg_insert(Batch)
+            .values(batch_id=batch_id, user_id=user_id)
+            .on_conflict_do_update(
+                index_elements=["batch_id"],
+                set_={"updated_at": func.now()},
+            )
+            .returning(Batch)
+        )
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
     async def create_with_user(
         self, db: AsyncSession, *, obj_in: BatchCreate, user_id: int
     ) -> Batch:
@@ -45,41 +156,75 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         )
         db.add(db_obj)
         await db.flush()
-        await db.refresh(db_obj)
         return db_obj
 
+    async def insert_shipment_rows(self, db: AsyncSession, *, rows: list[dict]) -> None:
+        """
+        Bulk-insert pre-built shipment rows; large row sets on PostgreSQL
+        go through COPY as a single binary frame
+        """
+        if not rows:
+            return
+
+        if len(rows) > _COPY_THRESHOLD and db.get_bind().dialect.name == "postgresql":
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                "batch_shipments",
+                records=[(row["batch_id"], row["shipment_id"]) for row in rows],
+                columns=["batch_id", "shipment_id"],
+            )
+            return
+
+        await db.execute(insert(BatchShipment), rows)
+
+    async def insert_rate_rows(self, db: AsyncSession, *, rows: list[dict]) -> None:
+        """
+        Bulk-insert pre-built rate rows
+        """
+        if rows:
+            await db.execute(insert(BatchRate), rows)
+
+    def build_shipment_rows(self, *, batch_id: int, shipment_ids: list[str]) -> list[dict]:
+        """
+        Build insertable row dicts for a list of shipment IDs; created_at
+        comes from the column's server default
+        """
+        return [
+            {"batch_id": batch_id, "shipment_id": shipment_id}
+            for shipment_id in shipment_ids
+        ]
+
+    def build_rate_rows(self, *, batch_id: int, rate_ids: list[str]) -> list[dict]:
+        """
+        Build insertable row dicts for a list of rate IDs; created_at
+        comes from the column's server default
+        """
+        return [
+            {"batch_id": batch_id, "rate_id": rate_id}
+            for rate_id in rate_ids
+        ]
+
     async def add_shipments(
         self, db: AsyncSession, *, batch: Batch, shipment_ids: list[str]
     ) -> Batch:
         """
-        Add shipments to batch
+        Add shipments to batch with a single bulk INSERT
         """
-        for shipment_id in shipment_ids:
-            shipment = BatchShipment(
-                batch_id=batch.id,
-                shipment_id=shipment_id,
-            )
-            db.add(shipment)
-
-        await db.flush()
-        await db.refresh(batch)
+        await self.insert_shipment_rows(
+            db, rows=self.build_shipment_rows(batch_id=batch.id, shipment_ids=shipment_ids)
+        )
         return batch
 
     async def add_rates(
         self, db: AsyncSession, *, batch: Batch, rate_ids: list[str]
     ) -> Batch:
         """
-        Add rates to batch
+        Add rates to batch with a single bulk INSERT
         """
-        for rate_id in rate_ids:
-            rate = BatchRate(
-                batch_id=batch.id,
-                rate_id=rate_id,
-            )
-            db.add(rate)
-
-        await db.flush()
-        await db.refresh(batch)
+        await self.insert_rate_rows(
+            db, rows=self.build_rate_rows(batch_id=batch.id, rate_ids=rate_ids)
+        )
         return batch
 
     async def remove_shipments(
@@ -89,13 +234,13 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         Remove shipments from batch
         """
         await db.execute(
-            delete(BatchShipment).where(
+            delete(BatchShipment)
+            .where(
                 BatchShipment.batch_id == batch.id,
                 BatchShipment.shipment_id.in_(shipment_ids),
             )
+            .execution_options(synchronize_session=False)
         )
-        await db.flush()
-        await db.refresh(batch)
         return batch
 
     async def remove_rates(
@@ -105,25 +250,26 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         Remove rates from batch
         """
         await db.execute(
-            delete(BatchRate).where(
+            delete(BatchRate)
+            .where(
                 BatchRate.batch_id == batch.id,
                 BatchRate.rate_id.in_(rate_ids),
             )
+            .execution_options(synchronize_session=False)
         )
-        await db.flush()
-        await db.refresh(batch)
         return batch
 
     async def get_errors(
-        self, db: AsyncSession, *, batch: Batch, skip: int = 0, limit: int = 25
+        self, db: AsyncSession, *, batch: Batch, after_id: int = 0, limit: int = 25
     ) -> list[BatchError]:
         """
-        Get paginated errors for a batch
+        Get errors for a batch with keyset pagination; cost stays O(limit)
+        regardless of how deep the caller has paged
         """
         result = await db.execute(
             select(BatchError)
-            .where(BatchError.batch_id == batch.id)
-            .offset(skip)
+            .where(BatchError.batch_id == batch.id, BatchError.id > after_id)
+            .order_by(BatchError.id)
             .limit(limit)
         )
         return list(result.scalars().all())
@@ -139,18 +285,24 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         source: Optional[str] = None,
     ) -> BatchError:
         """
-        Add error to batch
+        Add error to batch; multi-KB messages are stored compressed with a
+        short inline form so list scans stay narrow
         """
+        error_message_blob = None
+        if len(error_message) > _ERROR_MESSAGE_INLINE_MAX:
+            error_message_blob = zlib.compress(error_message.encode(), 6)
+            error_message = error_message[: _ERROR_MESSAGE_INLINE_MAX - 3] + "..."
+
         error = BatchError(
             batch_id=batch.id,
             error_code=error_code,
             error_message=error_message,
+            error_message_blob=error_message_blob,
             error_type=error_type,
             source=source,
         )
         db.add(error)
         await db.flush()
-        await db.refresh(error)
         return error
 
     async def update_status(
@@ -162,7 +314,6 @@ class CRUDBatch(CRUDBase[Batch, BatchCreate, BatchUpdate]):
         batch.status = status
         db.add(batch)
         await db.flush()
-        await db.refresh(batch)
         return batch
 
 
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 
 from sqlalchemy import select
@@ -7,6 +8,12 @@ from .crud_base import CRUDBase
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
 from ..core.security import get_password_hash, verify_password
+from ..utils.cache import cache
+
+# Scalar fields cached for the auth hot path; timestamps are left out so
+# a cache hit can be rebuilt with a plain User(**data)
+_USER_CACHE_FIELDS = ("id", "email", "hashed_password", "full_name", "is_active", "is_superuser")
+_USER_CACHE_TTL = 300
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -16,10 +23,25 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
     async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
         """
-        Get user by email address
+        Get user by email address, read through a Redis cache so login and
+        token flows skip Postgres on repeat lookups; the returned instance
+        is detached on a cache hit
         """
+        cached = await cache.get(f"user:email:{email}")
+        if cached:
+            return User(**cached)
+
         result = await db.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+        user = result.scalar_one_or_none()
+
+        if user is not None:
+            await cache.set(
+                f"user:email:{email}",
+                {field: getattr(user, field) for field in _USER_CACHE_FIELDS},
+                expire=_USER_CACHE_TTL,
+            )
+
+        return user
 
     async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """
@@ -35,6 +57,33 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db.add(db_obj)
         await db.flush()
         await db.refresh(db_obj)
+
+        # Drop any entry left over from a previously deleted user
+        await cache.delete(f"user:email:{db_obj.email}")
+
+        return db_obj
+
+    async def create_with_hash(
+        self, db: AsyncSession, *, obj_in: UserCreate, hashed_password: str
+    ) -> User:
+        """
+        Create new user from an already-computed password hash, skipping
+        the bcrypt kdf (bootstrap scripts hash off-loop or ship the hash
+        via configuration)
+        """
+        db_obj = User(
+            email=obj_in.email,
+            hashed_password=hashed_password,
+            full_name=obj_in.full_name,
+            is_active=obj_in.is_active,
+            is_superuser=obj_in.is_superuser,
+        )
+        db.add(db_obj)
+        await db.flush()
+        await db.refresh(db_obj)
+
+        await cache.delete(f"user:email:{db_obj.email}")
+
         return db_obj
 
     async def update(
@@ -49,7 +98,17 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
 
-        return await super().update(db, db_obj=db_obj, obj_in=update_data)
+        # Invalidate both lookup keys; cover the old and new email when
+        # the address itself changes
+        stale_keys = {f"user:email:{db_obj.email}", f"user:{db_obj.id}"}
+        if "email" in update_data:
+            stale_keys.add(f"user:email:{update_data['email']}")
+
+        user = await super().update(db, db_obj=db_obj, obj_in=update_data)
+
+        await cache.delete_many(*stale_keys)
+
+        return user
 
     async def authenticate(
         self, db: AsyncSession, *, email: str, password: str
@@ -60,7 +119,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = await self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        # bcrypt is CPU-bound; hash off-loop so concurrent requests proceed
+        if not await asyncio.to_thread(verify_password, password, user.hashed_password):
             return None
         return user
 
@@ -1,11 +1,22 @@
 from contextlib import asynccontextmanager
+import asyncio
+
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    # uvloop is an optional speedup; the stock asyncio loop works everywhere
+    pass
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api.v1 import login, users, batches
 from .core.config import settings
 from .utils.cache import cache
+from .utils.writer import writer
 
 
 @asynccontextmanager
@@ -13,10 +24,12 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events
     """
-    # Startup: Connect to Redis
+    # Startup: Connect to Redis and start the write-coalescing task
     await cache.connect()
+    await writer.start()
     yield
-    # Shutdown: Disconnect from Redis
+    # Shutdown: Stop the writer and disconnect from Redis
+    await writer.stop()
     await cache.disconnect()
 
 
@@ -25,13 +38,16 @@ app = FastAPI(
     description="Production-ready API for managing shipping batches with async PostgreSQL, Redis caching, and JWT authentication",
     version="1.0.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Set CORS middleware
+# Set CORS middleware; a fixed origin list lets the middleware take its
+# O(1) membership path instead of reflecting the Origin header (wildcard
+# plus credentials is also invalid per the CORS spec)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS or ["http://localhost:3000"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
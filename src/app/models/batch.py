@@ -1,7 +1,8 @@
 from datetime import datetime
 from typing import Optional
+import zlib
 
-from sqlalchemy import String, DateTime, Integer, Text, JSON, ForeignKey
+from sqlalchemy import String, DateTime, Index, Integer, LargeBinary, Text, JSON, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
@@ -13,8 +14,10 @@ class Batch(Base):
     """
 
     __tablename__ = "batches"
+    # Composite index lets ownership-scoped lookups resolve entirely in the index
+    __table_args__ = (Index("ix_batches_user_batch", "user_id", "batch_id"),)
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     batch_id: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     ship_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -23,21 +26,25 @@ class Batch(Base):
     display_scheme: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     status: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), onupdate=datetime.utcnow, nullable=False
     )
 
-    # Relationships
+    # Fetch the server-side timestamps with the INSERT's RETURNING so
+    # later attribute access never triggers a lazy load
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Relationships (selectin keeps async loads eager and avoids N+1 lazy SELECTs)
     shipments: Mapped[list["BatchShipment"]] = relationship(
-        "BatchShipment", back_populates="batch", cascade="all, delete-orphan"
+        "BatchShipment", back_populates="batch", cascade="all, delete-orphan", lazy="selectin"
     )
     rates: Mapped[list["BatchRate"]] = relationship(
-        "BatchRate", back_populates="batch", cascade="all, delete-orphan"
+        "BatchRate", back_populates="batch", cascade="all, delete-orphan", lazy="selectin"
     )
     errors: Mapped[list["BatchError"]] = relationship(
-        "BatchError", back_populates="batch", cascade="all, delete-orphan"
+        "BatchError", back_populates="batch", cascade="all, delete-orphan", lazy="selectin"
     )
 
     def __repr__(self) -> str:
@@ -50,16 +57,24 @@ class BatchShipment(Base):
     """
 
     __tablename__ = "batch_shipments"
+    # Composite index covers the batch-scoped removal DELETEs; bulk
+    # inserts never read the generated PKs back, so skip RETURNING
+    __table_args__ = (
+        Index("ix_batch_shipments_batch_shipment", "batch_id", "shipment_id"),
+        {"implicit_returning": False},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
-    shipment_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    # ShipEngine ids are well under 64 chars; the narrower type shrinks
+    # rows, index entries and buffer-cache footprint
+    shipment_id: Mapped[str] = mapped_column(String(64), nullable=False)
     tracking_number: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     carrier: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     service_code: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     label_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -75,16 +90,24 @@ class BatchRate(Base):
     """
 
     __tablename__ = "batch_rates"
+    # Composite index covers the batch-scoped removal DELETEs; bulk
+    # inserts never read the generated PKs back, so skip RETURNING
+    __table_args__ = (
+        Index("ix_batch_rates_batch_rate", "batch_id", "rate_id"),
+        {"implicit_returning": False},
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
-    rate_id: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
+    # ShipEngine ids are well under 64 chars; the narrower type shrinks
+    # rows, index entries and buffer-cache footprint
+    rate_id: Mapped[str] = mapped_column(String(64), nullable=False)
     carrier: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     service_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     amount: Mapped[Optional[float]] = mapped_column(nullable=True)
     currency: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -100,19 +123,32 @@ class BatchError(Base):
     """
 
     __tablename__ = "batch_errors"
+    # Composite index drives the keyset pagination scan on /errors
+    __table_args__ = (Index("ix_batch_errors_batch_id_id", "batch_id", "id"),)
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     batch_id: Mapped[int] = mapped_column(ForeignKey("batches.id"), nullable=False)
     error_code: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     error_message: Mapped[str] = mapped_column(Text, nullable=False)
+    error_message_blob: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
     error_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=func.now(), nullable=False
     )
 
     # Relationships
     batch: Mapped["Batch"] = relationship("Batch", back_populates="errors")
 
+    @property
+    def full_message(self) -> str:
+        """
+        Full error text: decompress the blob when the message was too
+        large to store inline, otherwise the inline message is complete
+        """
+        if self.error_message_blob is not None:
+            return zlib.decompress(self.error_message_blob).decode()
+        return self.error_message
+
     def __repr__(self) -> str:
         return f"<BatchError(id={self.id}, error_code={self.error_code})>"
@@ -1,6 +1,13 @@
 from datetime import datetime
-from typing import Optional, Any
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Annotated, Optional, Any
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, TypeAdapter
+
+# Bounded id lists: the length caps keep request work finite and give
+# pydantic-core a monomorphic validator for the element strings
+IdList = Annotated[
+    list[Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=64)]],
+    Field(max_length=1000),
+]
 
 
 class BatchShipmentBase(BaseModel):
@@ -152,8 +159,8 @@ class BatchAddRequest(BaseModel):
     Request schema for adding shipments/rates to a batch
     """
 
-    shipment_ids: list[str] = Field(default_factory=list, description="List of shipment IDs to add")
-    rate_ids: list[str] = Field(default_factory=list, description="List of rate IDs to add")
+    shipment_ids: IdList = Field(default_factory=list, description="List of shipment IDs to add")
+    rate_ids: IdList = Field(default_factory=list, description="List of rate IDs to add")
 
 
 class BatchRemoveRequest(BaseModel):
@@ -161,8 +168,8 @@ class BatchRemoveRequest(BaseModel):
     Request schema for removing shipments/rates from a batch
     """
 
-    shipment_ids: list[str] = Field(default_factory=list, description="List of shipment IDs to remove")
-    rate_ids: list[str] = Field(default_factory=list, description="List of rate IDs to remove")
+    shipment_ids: IdList = Field(default_factory=list, description="List of shipment IDs to remove")
+    rate_ids: IdList = Field(default_factory=list, description="List of rate IDs to remove")
 
 
 class BatchProcessLabelsRequest(BaseModel):
@@ -192,3 +199,12 @@ class PaginationParams(BaseModel):
 
     page: int = Field(default=1, ge=1, description="Page number")
     pagesize: int = Field(default=25, ge=1, le=100, description="Items per page")
+
+
+# Build the nested core schema once at import rather than lazily on the
+# first request
+Batch.model_rebuild()
+
+# Prebuilt list adapter: validating rows through it is a single
+# pydantic-core loop instead of a per-instance model_validate call
+BatchErrorListAdapter = TypeAdapter(list[BatchError])
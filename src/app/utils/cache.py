@@ -1,6 +1,8 @@
 from typing import Optional, Any
-import json
+
+import orjson
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 
 from ..core.config import settings
 
@@ -11,17 +13,26 @@ class RedisCache:
     """
 
     def __init__(self):
+        self.pool: Optional[aioredis.ConnectionPool] = None
         self.redis: Optional[aioredis.Redis] = None
 
     async def connect(self):
         """
-        Connect to Redis server
+        Connect to Redis server with an explicitly sized connection pool
         """
-        self.redis = await aioredis.from_url(
+        # Keep bytes on the wire: orjson parses straight from bytes and
+        # raw payloads skip the UTF-8 decode entirely. Keepalive plus a
+        # periodic health check lets pooled sockets survive idle spells
+        # without a per-request PING
+        self.pool = aioredis.ConnectionPool.from_url(
             settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
+            max_connections=64,
+            socket_keepalive=True,
+            retry_on_timeout=True,
+            health_check_interval=30,
+            decode_responses=False,
         )
+        self.redis = aioredis.Redis(connection_pool=self.pool)
 
     async def disconnect(self):
         """
@@ -29,22 +40,40 @@ class RedisCache:
         """
         if self.redis:
             await self.redis.close()
+        if self.pool:
+            await self.pool.disconnect()
 
     async def get(self, key: str) -> Optional[Any]:
         """
-        Get value from cache
+        Get value from cache; Redis outages degrade to a cache miss
         """
         if not self.redis:
             return None
 
-        value = await self.redis.get(key)
+        try:
+            value = await self.redis.get(key)
+        except RedisError:
+            return None
+
         if value:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 return value
         return None
 
+    async def get_raw(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache without deserializing it
+        """
+        if not self.redis:
+            return None
+
+        try:
+            return await self.redis.get(key)
+        except RedisError:
+            return None
+
     async def set(self, key: str, value: Any, expire: int = 300) -> bool:
         """
         Set value in cache with expiration time in seconds
@@ -52,10 +81,55 @@ class RedisCache:
         if not self.redis:
             return False
 
-        if not isinstance(value, str):
-            value = json.dumps(value)
+        if not isinstance(value, (str, bytes)):
+            value = orjson.dumps(value)
+
+        try:
+            return await self.redis.setex(key, expire, value)
+        except RedisError:
+            return False
 
-        return await self.redis.setex(key, expire, value)
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Get several values in one round trip; missing keys come back as None
+        """
+        if not self.redis or not keys:
+            return [None] * len(keys)
+
+        try:
+            values = await self.redis.mget(keys)
+        except RedisError:
+            return [None] * len(keys)
+
+        results: list[Optional[Any]] = []
+        for value in values:
+            if value is None:
+                results.append(None)
+                continue
+            try:
+                results.append(orjson.loads(value))
+            except orjson.JSONDecodeError:
+                results.append(value)
+        return results
+
+    async def mset_ex(self, mapping: dict[str, Any], expire: int = 300) -> bool:
+        """
+        Set several values with one pipelined round trip and a shared TTL
+        """
+        if not self.redis or not mapping:
+            return False
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    if not isinstance(value, (str, bytes)):
+                        value = orjson.dumps(value)
+                    pipe.setex(key, expire, value)
+                await pipe.execute()
+        except RedisError:
+            return False
+
+        return True
 
     async def delete(self, key: str) -> bool:
         """
@@ -64,7 +138,27 @@ class RedisCache:
         if not self.redis:
             return False
 
-        return await self.redis.delete(key) > 0
+        try:
+            return await self.redis.delete(key) > 0
+        except RedisError:
+            return False
+
+    async def delete_many(self, *keys: str) -> int:
+        """
+        Delete several keys in one pipelined round trip
+        """
+        if not self.redis or not keys:
+            return 0
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(key)
+                results = await pipe.execute()
+        except RedisError:
+            return 0
+
+        return sum(results)
 
     async def exists(self, key: str) -> bool:
         """
@@ -73,7 +167,10 @@ class RedisCache:
         if not self.redis:
             return False
 
-        return await self.redis.exists(key) > 0
+        try:
+            return await self.redis.exists(key) > 0
+        except RedisError:
+            return False
 
 
 cache = RedisCache()
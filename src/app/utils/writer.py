@@ -0,0 +1,86 @@
+from typing import Optional
+import asyncio
+
+from ..core.database import AsyncSessionLocal
+from ..crud.crud_batch import batch as crud_batch
+
+
+class BatchWriter:
+    """
+    Background single-writer task that coalesces concurrent shipment/rate
+    inserts into one transaction per drain cycle
+    """
+
+    def __init__(self, max_items: int = 500):
+        self.max_items = max_items
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """
+        Check if the writer task has been started
+        """
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """
+        Start the background writer task
+        """
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the background writer task
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._queue = None
+
+    async def submit(self, *, batch_id: int, shipment_ids: list[str], rate_ids: list[str]):
+        """
+        Enqueue shipment/rate inserts for a batch and wait until they are committed
+        """
+        shipment_rows = crud_batch.build_shipment_rows(batch_id=batch_id, shipment_ids=shipment_ids)
+        rate_rows = crud_batch.build_rate_rows(batch_id=batch_id, rate_ids=rate_ids)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((shipment_rows, rate_rows, future))
+        await future
+
+    async def _run(self):
+        """
+        Drain the queue and commit all pending inserts in one transaction per tick
+        """
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty() and len(items) < self.max_items:
+                items.append(self._queue.get_nowait())
+
+            shipment_rows = [row for item in items for row in item[0]]
+            rate_rows = [row for item in items for row in item[1]]
+
+            try:
+                async with AsyncSessionLocal() as session:
+                    await crud_batch.insert_shipment_rows(session, rows=shipment_rows)
+                    await crud_batch.insert_rate_rows(session, rows=rate_rows)
+                    await session.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_result(None)
+
+
+writer = BatchWriter()
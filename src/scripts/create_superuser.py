@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.core.database import AsyncSessionLocal
 from src.app.core.config import settings
+from src.app.core.security import get_password_hash
 from src.app.crud.crud_user import user as crud_user
 from src.app.schemas.user import UserCreate
 
@@ -24,6 +25,12 @@ async def create_superuser():
             print(f"Superuser with email {settings.ADMIN_EMAIL} already exists")
             return
 
+        # Use the configured hash when available, otherwise run the
+        # bcrypt kdf in a thread so startup tasks are not blocked
+        hashed_password = settings.ADMIN_PASSWORD_HASH or await asyncio.to_thread(
+            get_password_hash, settings.ADMIN_PASSWORD
+        )
+
         # Create superuser
         user_in = UserCreate(
             email=settings.ADMIN_EMAIL,
@@ -33,7 +40,9 @@ async def create_superuser():
             is_active=True,
         )
 
-        user_obj = await crud_user.create(db, obj_in=user_in)
+        user_obj = await crud_user.create_with_hash(
+            db, obj_in=user_in, hashed_password=hashed_password
+        )
         await db.commit()
 
         print(f"Superuser created successfully!")
@@ -1,107 +1,217 @@
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 import random
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.app.core.database import AsyncSessionLocal
 from src.app.core.config import settings
 from src.app.crud.crud_user import user as crud_user
-from src.app.crud.crud_batch import batch as crud_batch
 from src.app.schemas.user import UserCreate
-from src.app.schemas.batch import BatchCreate
-from src.app.models.batch import BatchShipment, BatchRate, BatchError
+from src.app.models.batch import Batch, BatchShipment, BatchRate, BatchError
+from src.app.models.user import User
 
 
-async def seed_database():
+def make_batch_id() -> str:
+    """
+    Generate a time-ordered batch ID so inserts land append-only
+    in the unique batch_id index instead of on random pages
+    """
+    return f"se-{time.time_ns():016x}{random.randrange(16**4):04x}"
+
+
+async def seed_database(fast: bool = False):
     print("=" * 60)
     print("SEEDING DATABASE")
     print("=" * 60)
     
     async with AsyncSessionLocal() as db:
         try:
-            # Create admin
-            admin = await crud_user.get_by_email(db, email=settings.ADMIN_EMAIL)
-            if not admin:
-                admin = await crud_user.create(db, obj_in=UserCreate(
+            if db.get_bind().dialect.name == "postgresql":
+                # Seed data is recreatable; skip the WAL fsync on commit
+                await db.execute(text("SET synchronous_commit = OFF"))
+
+            # Look up every seed account in one IN query instead of a
+            # round-trip per email
+            user_emails = [f"user{i}@example.com" for i in range(1, 4)]
+            result = await db.execute(
+                select(User).where(User.email.in_([settings.ADMIN_EMAIL] + user_emails))
+            )
+            existing_users = {u.email: u for u in result.scalars()}
+
+            # Create the missing accounts concurrently; each task gets
+            # its own session (sessions are not task-safe) so the bcrypt
+            # hashes and insert round-trips overlap
+            async def _create_user(obj_in: UserCreate) -> User:
+                async with AsyncSessionLocal() as session:
+                    user = await crud_user.create(session, obj_in=obj_in)
+                    await session.commit()
+                    return user
+
+            missing: list[UserCreate] = []
+            if settings.ADMIN_EMAIL not in existing_users:
+                missing.append(UserCreate(
                     email=settings.ADMIN_EMAIL,
                     password=settings.ADMIN_PASSWORD,
                     full_name="Admin User",
                     is_superuser=True,
                 ))
-                print(f"✓ Admin: {admin.email}")
-            else:
-                print(f"✓ Admin exists: {admin.email}")
-            
-            # Create test users
-            users = [admin]
-            for i in range(1, 4):
-                email = f"user{i}@example.com"
-                user = await crud_user.get_by_email(db, email=email)
-                if not user:
-                    user = await crud_user.create(db, obj_in=UserCreate(
+            for i, email in enumerate(user_emails, start=1):
+                if email not in existing_users:
+                    missing.append(UserCreate(
                         email=email,
                         password="password123",
                         full_name=f"Test User {i}",
                     ))
-                    print(f"✓ User: {email}")
-                users.append(user)
-            
-            await db.commit()
+
+            if missing:
+                created = await asyncio.gather(*(_create_user(obj) for obj in missing))
+                existing_users.update({u.email: u for u in created})
+                print(f"✓ Users created: {', '.join(u.email for u in created)}")
+
+            admin = existing_users[settings.ADMIN_EMAIL]
+            users = [admin] + [existing_users[email] for email in user_emails]
             
             # Create batches
             carriers = ["fedex", "ups", "usps", "dhl_express"]
             statuses = ["pending", "processing", "completed", "failed"]
             
             print("\nCreating batches...")
-            for user in users[:2]:
-                for i in range(5):
-                    batch_id = f"se-{random.randint(10000000, 99999999)}"
-                    existing = await crud_batch.get_by_batch_id(db, batch_id=batch_id)
-                    if existing:
-                        continue
-                    
-                    batch = await crud_batch.create_with_user(
-                        db,
-                        obj_in=BatchCreate(
-                            batch_id=batch_id,
-                            ship_date=datetime.utcnow() + timedelta(days=i+1),
-                            label_layout="4x6",
-                            label_format="pdf",
-                            display_scheme="label",
-                        ),
-                        user_id=user.id
+            # Accumulate child rows across the whole run and insert each
+            # table with one multi-VALUES statement at the end
+            shipment_rows: list[dict] = []
+            rate_rows: list[dict] = []
+            created_batches: list[str] = []
+
+            # Pre-reserve primary keys so batches and their children can
+            # all be assembled in memory before any insert runs
+            n_batches = len(users[:2]) * 5
+            result = await db.execute(
+                text("SELECT nextval('batches_id_seq') FROM generate_series(1, :n)"),
+                {"n": n_batches},
+            )
+            reserved_ids = list(result.scalars())
+
+            batch_values = [
+                {
+                    "id": reserved_ids[u * 5 + i],
+                    "batch_id": make_batch_id(),
+                    "user_id": user.id,
+                    "ship_date": datetime.utcnow() + timedelta(days=i + 1),
+                    "label_layout": "4x6",
+                    "label_format": "pdf",
+                    "display_scheme": "label",
+                    "status": random.choice(statuses),
+                }
+                for u, user in enumerate(users[:2])
+                for i in range(5)
+            ]
+
+            for row in batch_values:
+                batch_pk = row["id"]
+                batch_id = row["batch_id"]
+                batch_status = row["status"]
+                # Add shipments (draw all randomness for the batch in one go)
+                n_shipments = random.randint(2, 4)
+                ship_nums = random.choices(range(100000, 1000000), k=n_shipments)
+                track_nums = random.choices(range(100000, 1000000), k=n_shipments)
+                ship_carriers = random.choices(carriers, k=n_shipments)
+                shipment_rows.extend(
+                    {
+                        "batch_id": batch_pk,
+                        "shipment_id": f"ship-{ship_num}",
+                        "tracking_number": f"1Z{track_num:08d}",
+                        "carrier": carrier,
+                        "service_code": "priority",
+                    }
+                    for ship_num, track_num, carrier in zip(ship_nums, track_nums, ship_carriers)
+                )
+
+                # Add rates (randomness pre-drawn in bulk like shipments)
+                n_rates = 2
+                rate_nums = random.choices(range(100000, 1000000), k=n_rates)
+                rate_carriers = random.choices(carriers, k=n_rates)
+                rate_amounts = [round(15.0 + 85.0 * random.random(), 2) for _ in range(n_rates)]
+                rate_rows.extend(
+                    {
+                        "batch_id": batch_pk,
+                        "rate_id": f"rate-{rate_num}",
+                        "carrier": carrier,
+                        "service_type": "priority",
+                        "amount": amount,
+                        "currency": "USD",
+                    }
+                    for rate_num, carrier, amount in zip(rate_nums, rate_carriers, rate_amounts)
+                )
+
+                # Buffer the progress output; a print per batch flushes
+                # stdout once per row in large seeds
+                created_batches.append(f"{batch_id} ({batch_status})")
+
+            # One conflict-aware statement for every batch; the pre-assigned
+            # ids mean the child rows above never wait on RETURNING
+            result = await db.execute(
+                pg_insert(Batch)
+                .on_conflict_do_nothing(index_elements=["batch_id"])
+                .returning(Batch.id),
+                batch_values,
+            )
+            surviving = set(result.scalars())
+            if len(surviving) != len(batch_values):
+                # A batch_id collision skipped a row; drop its children too
+                shipment_rows = [r for r in shipment_rows if r["batch_id"] in surviving]
+                rate_rows = [r for r in rate_rows if r["batch_id"] in surviving]
+
+            if fast and db.get_bind().dialect.name == "postgresql":
+                # Stream the child rows through asyncpg COPY: one binary
+                # frame per table with no per-row bind overhead
+                conn = await db.connection()
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                if shipment_rows:
+                    await driver.copy_records_to_table(
+                        "batch_shipments",
+                        records=[
+                            (r["batch_id"], r["shipment_id"], r["tracking_number"],
+                             r["carrier"], r["service_code"])
+                            for r in shipment_rows
+                        ],
+                        columns=["batch_id", "shipment_id", "tracking_number",
+                                 "carrier", "service_code"],
                     )
-                    batch.status = random.choice(statuses)
-                    
-                    # Add shipments
-                    for j in range(random.randint(2, 4)):
-                        db.add(BatchShipment(
-                            batch_id=batch.id,
-                            shipment_id=f"ship-{random.randint(100000, 999999)}",
-                            tracking_number=f"1Z{random.randint(100000, 999999):08d}",
-                            carrier=random.choice(carriers),
-                            service_code="priority",
-                        ))
-                    
-                    # Add rates
-                    for j in range(2):
-                        db.add(BatchRate(
-                            batch_id=batch.id,
-                            rate_id=f"rate-{random.randint(100000, 999999)}",
-                            carrier=random.choice(carriers),
-                            service_type="priority",
-                            amount=round(random.uniform(15.0, 100.0), 2),
-                            currency="USD",
-                        ))
-                    
-                    print(f"✓ Batch: {batch_id} ({batch.status})")
-                
-                await db.commit()
-            
+                if rate_rows:
+                    await driver.copy_records_to_table(
+                        "batch_rates",
+                        records=[
+                            (r["batch_id"], r["rate_id"], r["carrier"],
+                             r["service_type"], r["amount"], r["currency"])
+                            for r in rate_rows
+                        ],
+                        columns=["batch_id", "rate_id", "carrier",
+                                 "service_type", "amount", "currency"],
+                    )
+            else:
+                # Two bulk INSERTs instead of one statement per child row
+                if shipment_rows:
+                    await db.execute(insert(BatchShipment), shipment_rows)
+                if rate_rows:
+                    await db.execute(insert(BatchRate), rate_rows)
+
+            # Single commit for the whole run: one WAL flush instead of
+            # one per user
+            await db.commit()
+
+            print("\n".join(f"✓ Batch: {line}" for line in created_batches))
+            print(f"✓ Batches: {len(created_batches)}, "
+                  f"shipments: {len(shipment_rows)}, rates: {len(rate_rows)}")
+
             print("\n" + "=" * 60)
             print("SUCCESS!")
             print("=" * 60)
@@ -116,4 +226,19 @@ async def seed_database():
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        # uvloop is an optional speedup; the stock asyncio loop works everywhere
+        pass
+
+    parser = argparse.ArgumentParser(description="Seed the database with demo data")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Stream child rows via asyncpg COPY instead of bulk INSERT (PostgreSQL only)",
+    )
+    args = parser.parse_args()
+    asyncio.run(seed_database(fast=args.fast))
@@ -3,6 +3,9 @@ from httpx import AsyncClient
 
 from app.core.config import settings
 
+API = settings.API_V1_STR
+LOGIN_URL = f"{API}/login"
+
 
 @pytest.mark.asyncio
 async def test_login_success(client: AsyncClient, test_user):
@@ -14,7 +17,7 @@ async def test_login_success(client: AsyncClient, test_user):
         "password": "testpassword",
     }
 
-    response = await client.post(f"{settings.API_V1_STR}/login", data=login_data)
+    response = await client.post(LOGIN_URL, data=login_data)
     assert response.status_code == 200
 
     data = response.json()
@@ -32,7 +35,7 @@ async def test_login_wrong_password(client: AsyncClient, test_user):
         "password": "wrongpassword",
     }
 
-    response = await client.post(f"{settings.API_V1_STR}/login", data=login_data)
+    response = await client.post(LOGIN_URL, data=login_data)
     assert response.status_code == 400
 
 
@@ -46,5 +49,5 @@ async def test_login_nonexistent_user(client: AsyncClient):
         "password": "somepassword",
     }
 
-    response = await client.post(f"{settings.API_V1_STR}/login", data=login_data)
+    response = await client.post(LOGIN_URL, data=login_data)
     assert response.status_code == 400
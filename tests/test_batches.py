@@ -1,7 +1,15 @@
+import asyncio
+from datetime import timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import update
 
 from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.user import User
+
+API = settings.API_V1_STR
 
 
 @pytest.mark.asyncio
@@ -16,7 +24,7 @@ async def test_create_batch(client: AsyncClient, user_token_headers):
     }
 
     response = await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/add",
+        f"{API}/batches/{batch_id}/add",
         json=data,
         headers=user_token_headers,
     )
@@ -25,53 +33,28 @@ async def test_create_batch(client: AsyncClient, user_token_headers):
 
 
 @pytest.mark.asyncio
-async def test_get_batch(client: AsyncClient, user_token_headers):
+async def test_get_batch(client: AsyncClient, user_token_headers, created_batch):
     """
     Test getting batch information
     """
-    # First create a batch
-    batch_id = "test-batch-002"
-    data = {
-        "shipment_ids": ["ship-003"],
-        "rate_ids": [],
-    }
-
-    await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/add",
-        json=data,
-        headers=user_token_headers,
-    )
-
-    # Get the batch
     response = await client.get(
-        f"{settings.API_V1_STR}/batches/{batch_id}",
+        f"{API}/batches/{created_batch}",
         headers=user_token_headers,
     )
 
     assert response.status_code == 200
     batch_data = response.json()
-    assert batch_data["batch_id"] == batch_id
+    assert batch_data["batch_id"] == created_batch
     assert len(batch_data["shipments"]) == 1
 
 
 @pytest.mark.asyncio
-async def test_get_batch_errors(client: AsyncClient, user_token_headers):
+async def test_get_batch_errors(client: AsyncClient, user_token_headers, created_batch):
     """
     Test getting batch errors with pagination
     """
-    batch_id = "test-batch-003"
-
-    # Create batch
-    data = {"shipment_ids": ["ship-004"], "rate_ids": []}
-    await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/add",
-        json=data,
-        headers=user_token_headers,
-    )
-
-    # Get errors
     response = await client.get(
-        f"{settings.API_V1_STR}/batches/{batch_id}/errors?page=1&pagesize=25",
+        f"{API}/batches/{created_batch}/errors?pagesize=25",
         headers=user_token_headers,
     )
 
@@ -82,21 +65,10 @@ async def test_get_batch_errors(client: AsyncClient, user_token_headers):
 
 
 @pytest.mark.asyncio
-async def test_process_batch_labels(client: AsyncClient, user_token_headers):
+async def test_process_batch_labels(client: AsyncClient, user_token_headers, created_batch):
     """
     Test processing batch labels
     """
-    batch_id = "test-batch-004"
-
-    # Create batch
-    data = {"shipment_ids": ["ship-005"], "rate_ids": []}
-    await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/add",
-        json=data,
-        headers=user_token_headers,
-    )
-
-    # Process labels
     process_data = {
         "ship_date": "2026-02-10T10:00:00",
         "label_layout": "4x6",
@@ -105,7 +77,7 @@ async def test_process_batch_labels(client: AsyncClient, user_token_headers):
     }
 
     response = await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/process/labels",
+        f"{API}/batches/{created_batch}/process/labels",
         json=process_data,
         headers=user_token_headers,
     )
@@ -114,31 +86,17 @@ async def test_process_batch_labels(client: AsyncClient, user_token_headers):
 
 
 @pytest.mark.asyncio
-async def test_remove_from_batch(client: AsyncClient, user_token_headers):
+async def test_remove_from_batch(client: AsyncClient, user_token_headers, created_batch):
     """
     Test removing items from batch
     """
-    batch_id = "test-batch-005"
-
-    # Create batch
-    data = {
-        "shipment_ids": ["ship-006", "ship-007"],
-        "rate_ids": ["rate-002"],
-    }
-    await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/add",
-        json=data,
-        headers=user_token_headers,
-    )
-
-    # Remove items
     remove_data = {
-        "shipment_ids": ["ship-006"],
-        "rate_ids": ["rate-002"],
+        "shipment_ids": ["ship-001"],
+        "rate_ids": [],
     }
 
     response = await client.post(
-        f"{settings.API_V1_STR}/batches/{batch_id}/remove",
+        f"{API}/batches/{created_batch}/remove",
         json=remove_data,
         headers=user_token_headers,
     )
@@ -152,7 +110,7 @@ async def test_get_nonexistent_batch(client: AsyncClient, user_token_headers):
     Test getting nonexistent batch returns 404
     """
     response = await client.get(
-        f"{settings.API_V1_STR}/batches/nonexistent-batch",
+        f"{API}/batches/nonexistent-batch",
         headers=user_token_headers,
     )
 
@@ -164,6 +122,74 @@ async def test_unauthorized_access(client: AsyncClient):
     """
     Test accessing batch endpoints without authentication
     """
-    response = await client.get(f"{settings.API_V1_STR}/batches/some-batch")
+    response = await client.get(f"{API}/batches/some-batch")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_independent_scenarios_concurrently(client: AsyncClient, user_token_headers):
+    """
+    Fire independent scenarios through the in-process transport at once;
+    they share nothing, so the session pool handles them in parallel
+    """
+
+    async def _create_batch():
+        response = await client.post(
+            f"{API}/batches/test-batch-parallel/add",
+            json={"shipment_ids": ["ship-101", "ship-102"], "rate_ids": ["rate-101"]},
+            headers=user_token_headers,
+        )
+        assert response.status_code == 204
+
+    async def _nonexistent_batch():
+        response = await client.get(
+            f"{API}/batches/nonexistent-parallel",
+            headers=user_token_headers,
+        )
+        assert response.status_code == 404
+
+    async def _unauthorized():
+        response = await client.get(f"{API}/batches/some-batch")
+        assert response.status_code == 401
+
+    await asyncio.gather(_create_batch(), _nonexistent_batch(), _unauthorized())
+
+
+@pytest.mark.asyncio
+async def test_add_to_batch_deleted_user(client: AsyncClient):
+    """
+    Test that a valid token for a nonexistent user cannot create batches
+    """
+    token = create_access_token(subject=999999)
+
+    response = await client.post(
+        f"{API}/batches/ghost-batch/add",
+        json={"shipment_ids": ["ship-001"], "rate_ids": []},
+        headers={"Authorization": f"Bearer {token}"},
+    )
 
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_add_to_batch_inactive_user(client: AsyncClient, db_session, test_user):
+    """
+    Test that a token issued before deactivation cannot create batches
+    """
+    # Distinct expiry so this token misses the in-process token cache
+    # warmed by the session-scoped login
+    token = create_access_token(subject=test_user.id, expires_delta=timedelta(minutes=5))
+
+    await db_session.execute(
+        update(User).where(User.id == test_user.id).values(is_active=False)
+    )
+    db_session.expire_all()
+
+    response = await client.post(
+        f"{API}/batches/inactive-batch/add",
+        json={"shipment_ids": ["ship-001"], "rate_ids": []},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 400